@@ -50,8 +50,10 @@ class Category(Resource):
 
     def tasks(self):
         """Return a list of the user tasks that belongs to selected category."""
-        tasks = self.user.tasks()
-        return [task for task in tasks if task.categoryId == self['id']]
+        category_id = self['id']
+        return [
+            task for task in self.user.tasks() if task.data_dict.get('categoryId') == category_id
+        ]
 
     def add_task(self, task):
         """
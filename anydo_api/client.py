@@ -6,8 +6,6 @@ anydo_api.client.
 `Client` class.
 """
 
-import requests
-
 from anydo_api import request
 from anydo_api.constants import CONSTANTS
 from anydo_api.user import User
@@ -21,6 +19,8 @@ class Client(object):
     Responsible for authentication and session management.
     """
 
+    _login_headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+
     def __init__(self, email, password):
         """Constructor for Client."""
         self.session = self.__log_in(email, password)
@@ -41,6 +41,18 @@ class Client(object):
 
         return self.user
 
+    def close(self):
+        """Close the underlying session and release its pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        """Allow the client to be used as a context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the session on leaving the context."""
+        self.close()
+
     def __log_in(self, email, password):
         """
         Authentication base on `email` and `password`.
@@ -53,13 +65,12 @@ class Client(object):
             '_spring_security_remember_me': 'on'
         }
 
-        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
-        self.session = requests.Session()
+        self.session = request.new_session()
 
         request.post(
             url=CONSTANTS.get('LOGIN_URL'),
             session=self.session,
-            headers=headers,
+            headers=self._login_headers,
             data=credentials,
             response_json=False
         )
@@ -76,7 +87,7 @@ class Client(object):
             'username': fields.get('email'),
             'password': fields.get('password'),
             'emails': fields.get('emails', fields.get('email')),
-            'phoneNumbers': fields.get('phone_numbers', [])
+            'phoneNumbers': fields.get('phone_numbers') or ()
         }
 
         request.post(
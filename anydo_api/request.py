@@ -9,14 +9,53 @@ Wrapped `requests` methods with default headers and options.
 
 import requests
 
-from anydo_api import errors
+try:
+    import orjson
+    __json_loads = orjson.loads # pylint: disable=no-member
+    __json_dumps = orjson.dumps # pylint: disable=no-member
+except ImportError:
+    import json
+
+    def __json_loads(content):
+        """Decode JSON from response bytes with the stdlib codec."""
+        return json.loads(content.decode('utf-8'))
 
-__all__ = ('get', 'post', 'put', 'delete')
+    __json_dumps = json.dumps
 
 try:
-    __SERVER_ERRORS = xrange(500, 600) # pylint: disable=undefined-variable
-except NameError:
-    __SERVER_ERRORS = range(500, 600)
+    import ijson
+except ImportError:
+    ijson = None
+
+from anydo_api import errors
+
+__all__ = ('get', 'post', 'put', 'delete', 'new_session')
+
+# `Accept-Encoding` is left to `requests`, which advertises every encoding
+# the installed urllib3 is able to decode (br and zstd included)
+DEFAULT_HEADERS = {
+    'Content-Type'   : 'application/json',
+    'Accept'         : 'application/json',
+}
+
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+
+__RETRY_OPTIONS = {
+    'total'           : 3,
+    'backoff_factor'  : 0.3,
+    'status_forcelist': (502, 503, 504),
+    'raise_on_status' : False,
+}
+# HTTP status codes mapped to custom errors, others are treated as server errors
+__CLIENT_ERRORS = {
+    400: errors.BadRequestError,
+    401: errors.UnauthorizedError,
+    409: errors.ConflictError,
+}
+
+# POST is not idempotent (it creates resources), so it is never retried
+__RETRY_METHODS = frozenset(['GET', 'PUT', 'DELETE'])
 
 def get(url, **options):
     """Simple GET request wrapper."""
@@ -34,44 +73,76 @@ def delete(url, **options):
     """Simple DELETE request wrapper."""
     return __base_request(method='delete', url=url, **options)
 
+def new_session():
+    """
+    Return a `requests.Session` prepared for API calls.
+
+    Default headers are set once and a sized connection pool with retries
+    is mounted, so subsequent requests reuse kept-alive connections.
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=__retry_policy()
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    return session
+
+def __retry_policy():
+    """Return a retry policy for idempotent requests failed with gateway errors."""
+    retry_class = requests.packages.urllib3.util.Retry
+    options = __RETRY_OPTIONS.copy()
+    try:
+        return retry_class(allowed_methods=__RETRY_METHODS, **options)
+    except TypeError: # urllib3 < 1.26
+        pass
+
+    try:
+        return retry_class(method_whitelist=__RETRY_METHODS, **options)
+    except TypeError: # urllib3 < 1.15
+        options.pop('raise_on_status')
+        return retry_class(method_whitelist=__RETRY_METHODS, **options)
+
 
 def __prepare_request_arguments(**options):
     """Return a dict representing default request arguments."""
     options = options.copy()
 
-    headers = {
-        'Content-Type'   : 'application/json',
-        'Accept'         : 'application/json',
-        'Accept-Encoding': 'deflate',
-    }
-
     params = options.pop('params') if 'params' in options else ''
     timeout = options.pop('timeout') if 'timeout' in options else 5 # don't hung the client to long
 
-    if 'headers' in options:
-        headers.update(options.pop('headers'))
-
+    # default headers are set on the session, only per-request overrides are passed
     request_arguments = {
-        'headers': headers,
+        'headers': options.pop('headers') if 'headers' in options else None,
         'params' : params,
         'timeout': timeout,
     }
 
+    # encode bodies ourselves to use the fastest available JSON codec
+    if 'json' in options:
+        options['data'] = __json_dumps(options.pop('json'))
+
     request_arguments.update(options)
     return request_arguments
 
 def __check_response_for_errors(response):
     """Raise and exception in case of HTTP error during API call, mapped to custom errors."""
+    # successful responses skip the exception machinery of `raise_for_status`
+    if response.status_code < 400:
+        return
+
     # bug in PyLint, seems not merged in 1.5.5 yet https://github.com/PyCQA/pylint/pull/742
     try:
         response.raise_for_status()
     except requests.exceptions.HTTPError as error:
-        if response.status_code == 400:
-            client_error = errors.BadRequestError(response.content)
-        elif response.status_code == 401:
-            client_error = errors.UnauthorizedError(response.content)
-        elif response.status_code == 409:
-            client_error = errors.ConflictError(response.content)
+        error_class = __CLIENT_ERRORS.get(response.status_code)
+        if error_class:
+            client_error = error_class(response.content)
         else:
             client_error = errors.InternalServerError(error)
         # should we skip original cause of exception or not?
@@ -86,21 +157,55 @@ def __base_request(method, url, session=None, **options):
     Forward other arguments into `request` object from the `request` library.
     """
     response_json = options.pop('response_json') if 'response_json' in options else True
-    if not session:
-        session = requests.Session()
+    # decode a JSON array response lazily item by item, if `ijson` is available
+    stream_items = options.pop('stream_items') if 'stream_items' in options else False
+    stream_items = stream_items and response_json and ijson is not None
+    # a passed session is owned by the caller and kept open to reuse its connections
+    temporary_session = not session
+    if temporary_session:
+        session = new_session()
     request_arguments = __prepare_request_arguments(**options)
+    if stream_items:
+        request_arguments['stream'] = True
 
-    if method == 'get':
-        adapter = requests.packages.urllib3.util.Retry(total=2, status_forcelist=__SERVER_ERRORS)
-
-        session.mount('http://', requests.adapters.HTTPAdapter(max_retries=adapter))
-        session.mount('https://', requests.adapters.HTTPAdapter(max_retries=adapter))
+    try:
+        response = getattr(session, method)(url, **request_arguments)
+    finally:
+        if temporary_session:
+            session.close()
 
-    response = getattr(session, method)(url, **request_arguments)
-    session.close()
-    __check_response_for_errors(response)
+    try:
+        __check_response_for_errors(response)
+    except (errors.ClientError, requests.exceptions.RequestException):
+        # a streamed response keeps its pooled connection until closed
+        response.close()
+        raise
 
     if response_json and method != 'delete':
-        return response.json()
+        if stream_items:
+            return __iterate_items(response)
+
+        return __json_loads(response.content)
 
     return response
+
+def __iterate_items(response):
+    """Yield items of a JSON array response without loading the whole body in memory."""
+    urllib3_errors = requests.packages.urllib3.exceptions
+    response.raw.decode_content = True
+    # errors are remapped the same way as `requests` does for a buffered body
+    try:
+        # pylint: disable=use-yield-from
+        # `yield from` is not available on Python 2
+        for item in ijson.items(response.raw, 'item', use_float=True):
+            yield item
+    except urllib3_errors.ProtocolError as error:
+        raise requests.exceptions.ChunkedEncodingError(error)
+    except urllib3_errors.DecodeError as error:
+        raise requests.exceptions.ContentDecodingError(error)
+    except urllib3_errors.ReadTimeoutError as error:
+        raise requests.exceptions.ConnectionError(error)
+    except ijson.JSONError as error:
+        raise ValueError('Invalid JSON response: {}'.format(error))
+    finally:
+        response.close()
@@ -25,6 +25,10 @@ class Resource(object):
 
     _reserved_attrs = ('data_dict', 'is_dirty')
     _endpoint = ''
+    _create_params = {
+        'includeDeleted': 'false',
+        'includeDone'   : 'false',
+    }
 
     def __init__(self, data_dict):
         """Constructor for generic Resource."""
@@ -108,6 +112,7 @@ class Resource(object):
             url=alternate_endpoint or (self.get_endpoint() + '/' + self['id']),
             session=self.session()
         )
+        self.is_dirty = False
 
         return self
 
@@ -160,16 +165,11 @@ class Resource(object):
         json_data = fields.copy()
         json_data.update({'id': cls.generate_uid()})
 
-        params = {
-            'includeDeleted': 'false',
-            'includeDone'   : 'false',
-        }
-
         response_obj = request.post(
             url=cls._endpoint,
             session=user.session(),
             json=[json_data],
-            params=params
+            params=cls._create_params
         )
 
         return cls._create_callback(response_obj, user)
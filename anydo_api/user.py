@@ -6,6 +6,8 @@
 `User` class.
 """
 
+from multiprocessing.pool import ThreadPool
+
 from anydo_api import request
 from anydo_api import errors
 from anydo_api.category import Category
@@ -15,6 +17,14 @@ from anydo_api.task import Task
 
 __all__ = ('User')
 
+# endpoints are resolved once at import instead of on every API call
+_ME_URL = CONSTANTS.get('ME_URL')
+_USER_URL = CONSTANTS.get('USER_URL')
+_TASKS_URL = CONSTANTS.get('TASKS_URL')
+_CATEGORIES_URL = CONSTANTS.get('CATEGORIES_URL')
+_PENDING_URL = _ME_URL + '/pending'
+_PENDING_ACCEPT_URL = (_PENDING_URL + '/{}/accept').format
+
 class User(Resource):
     """
     `User` is the class representing User object.
@@ -23,9 +33,9 @@ class User(Resource):
     responsible for user management.
     """
 
-    _endpoint = CONSTANTS.get('ME_URL')
+    _endpoint = _ME_URL
     _reserved_attrs = ('data_dict', 'session_obj', 'is_dirty')
-    __alternate_endpoint = CONSTANTS.get('USER_URL')
+    __alternate_endpoint = _USER_URL
 
     def __init__(self, data_dict, session):
         """Constructor for User."""
@@ -73,16 +83,17 @@ class User(Resource):
               include_checked=True,
               include_unchecked=True):
         """Return a remote or chached task list for user."""
-        if not self.tasks_list or refresh:
+        if self.tasks_list is None or refresh:
             params = {
                 'includeDeleted': str(include_deleted).lower(),
                 'includeDone': str(include_done).lower(),
             }
 
             tasks_data = request.get(
-                url=CONSTANTS.get('TASKS_URL'),
+                url=_TASKS_URL,
                 session=self.session(),
-                params=params
+                params=params,
+                stream_items=True
             )
 
             self.tasks_list = [Task(data_dict=task, user=self) for task in tasks_data]
@@ -95,15 +106,16 @@ class User(Resource):
 
     def categories(self, refresh=False, include_deleted=False):
         """Return a remote or cached categories list for user."""
-        if not self.categories_list or refresh:
+        if self.categories_list is None or refresh:
             params = {
                 'includeDeleted': str(include_deleted).lower(),
             }
 
             categories_data = request.get(
-                url=CONSTANTS.get('CATEGORIES_URL'),
+                url=_CATEGORIES_URL,
                 session=self.session(),
-                params=params
+                params=params,
+                stream_items=True
             )
 
             self.categories_list = [
@@ -132,7 +144,8 @@ class User(Resource):
 
     def default_category(self):
         """Return default category for user if exist."""
-        return next((cat for cat in self.categories() if cat.isDefault), None)
+        # read the raw data to skip `__getattr__` fallback for every category
+        return next((cat for cat in self.categories() if cat.data_dict.get('isDefault')), None)
 
     def pending_tasks(self, refresh=False):
         """
@@ -140,9 +153,9 @@ class User(Resource):
 
         Empty list otherwise.
         """
-        if not self._pending_tasks or refresh:
+        if self._pending_tasks is None or refresh:
             response_obj = request.get(
-                url=self.get_endpoint() + '/pending',
+                url=_PENDING_URL,
                 session=self.session()
             )
 
@@ -171,12 +184,49 @@ class User(Resource):
             )
 
         response_obj = request.post(
-            url=self.get_endpoint() + '/pending/' + task_id + '/accept',
+            url=_PENDING_ACCEPT_URL(task_id),
             session=self.session()
         )
 
         return response_obj
 
+    def approve_pending_tasks(self, pending_tasks_ids):
+        """
+        Approve a batch of pending tasks via concurrent API calls.
+
+        Requests share the user session connection pool.
+        Return a tuple of two dicts keyed by pending task id: `approved` with
+        the API responses and `failed` with the exceptions raised for the rest.
+        A failure of one task does not affect the others, so only the failed
+        ids need to be retried.
+        """
+        approved, failed = {}, {}
+        pending_tasks_ids = list(pending_tasks_ids)
+        if not pending_tasks_ids:
+            return approved, failed
+
+        pool = ThreadPool(min(len(pending_tasks_ids), request.POOL_MAXSIZE))
+        try:
+            results = pool.map(self.__try_approve_pending_task, pending_tasks_ids)
+        finally:
+            pool.close()
+            pool.join()
+
+        for task_id, response_obj, error in results:
+            if error is None:
+                approved[task_id] = response_obj
+            else:
+                failed[task_id] = error
+
+        return approved, failed
+
+    def __try_approve_pending_task(self, pending_task_id):
+        """Approve a pending task, return a tuple of its id, response and occured error."""
+        try:
+            return pending_task_id, self.approve_pending_task(pending_task_id=pending_task_id), None
+        except Exception as error: # pylint: disable=broad-except
+            return pending_task_id, None, error
+
     @staticmethod
     def required_attributes():
         """
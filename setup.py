@@ -25,6 +25,9 @@ test_requirements = [
 
 extras_require = {
     ':python_version in "2.7"': ['contextlib2', 'mock'],
+    'orjson': ['orjson'],
+    'ijson': ['ijson>=3.1'],
+    'brotli': ['brotli'],
 }
 
 setup(
@@ -51,6 +51,13 @@ class TestCategory(TestCase):
             user.categories()
             user.categories()
 
+    def test_locally_deleted_categories_are_filtered_out(self):
+        user = self.get_me()
+        with vcr.use_cassette('fixtures/vcr_cassettes/categories.json', record_mode='once'):
+            count = len(user.categories())
+            user.categories()[0]['isDeleted'] = True
+            self.assertEqual(count - 1, len(user.categories()))
+
     def test_user_categories_could_be_refreshed_from_the_server(self):
         user = self.get_me()
         with self.assertRaises(vcr_module.errors.CannotOverwriteExistingCassetteException):
@@ -11,6 +11,11 @@ Tests for `Client` class.
 import unittest
 import vcr as vcr_module
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 from tests import base
 from tests.test_helper import vcr
 
@@ -61,6 +66,24 @@ class TestClient(base.TestCase):
                 user.get_user(refresh=True)
                 user.get_user(refresh=True)
 
+    def test_client_could_be_used_as_context_manager(self):
+        with vcr.use_cassette(
+            'fixtures/vcr_cassettes/valid_login.json',
+            filter_post_data_parameters=['j_password']
+        ):
+            client = Client(email=self.email, password=self.password)
+
+        with mock.patch.object(client.session, 'close', wraps=client.session.close) as close:
+            with client:
+                with vcr.use_cassette(
+                    'fixtures/vcr_cassettes/me.json',
+                    filter_post_data_parameters=['j_password']
+                ):
+                    client.get_user()
+                self.assertFalse(close.called)
+
+            close.assert_called_once_with()
+
 #access-control-max-age": "21600"
 
 if __name__ == '__main__':
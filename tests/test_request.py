@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_request
+----------------------------------
+
+Tests for `request` module.
+"""
+
+import io
+import unittest
+
+import requests
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from anydo_api import errors
+from anydo_api import request
+
+class TestRequest(unittest.TestCase):
+    def setUp(self):
+        self.session = request.new_session()
+
+    def tearDown(self):
+        self.session.close()
+        del self.session
+
+    def test_new_session_has_default_headers(self):
+        for header, value in request.DEFAULT_HEADERS.items():
+            self.assertEqual(value, self.session.headers[header])
+
+    def test_compressed_responses_are_accepted_as_urllib3_supports(self):
+        self.assertEqual(
+            requests.utils.default_headers()['Accept-Encoding'],
+            self.session.headers['Accept-Encoding']
+        )
+
+    def test_new_session_shares_one_pooled_adapter(self):
+        adapter = self.session.get_adapter('https://')
+        self.assertIs(adapter, self.session.get_adapter('http://'))
+        self.assertEqual(request.POOL_MAXSIZE, adapter.poolmanager.connection_pool_kw['maxsize'])
+        self.assertFalse(adapter.max_retries.is_retry('POST', 503))
+        self.assertTrue(adapter.max_retries.is_retry('GET', 503))
+
+    def test_new_session_supports_old_retry_signature(self):
+        retry_class = request.requests.packages.urllib3.util.Retry
+
+        def old_retry(total, backoff_factor, status_forcelist, method_whitelist):
+            return retry_class(
+                total=total,
+                backoff_factor=backoff_factor,
+                status_forcelist=status_forcelist
+            )
+
+        with mock.patch('requests.packages.urllib3.util.Retry', side_effect=old_retry) as retry:
+            request.new_session().close()
+
+        self.assertNotIn('raise_on_status', retry.call_args[1])
+        self.assertIn('method_whitelist', retry.call_args[1])
+
+    def __streamed_response(self, status_code, body):
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = 'https://example.com/items'
+        response.raw = io.BytesIO(body)
+        response.close = mock.Mock()
+        return response
+
+    def __get_items(self, response):
+        session = mock.Mock(get=mock.Mock(return_value=response))
+        return list(request.get(url=response.url, session=session, stream_items=True))
+
+    @unittest.skipIf(request.ijson is None, 'ijson is not installed')
+    def test_streamed_items_are_decoded_and_response_closed(self):
+        response = self.__streamed_response(200, b'[{"id": "1"}, {"id": "2"}]')
+
+        self.assertEqual([{'id': '1'}, {'id': '2'}], self.__get_items(response))
+        self.assertTrue(response.close.called)
+
+    @unittest.skipIf(request.ijson is None, 'ijson is not installed')
+    def test_streamed_error_response_is_closed(self):
+        response = self.__streamed_response(503, b'')
+
+        with self.assertRaises(errors.InternalServerError):
+            self.__get_items(response)
+        self.assertTrue(response.close.called)
+
+    @unittest.skipIf(request.ijson is None, 'ijson is not installed')
+    def test_truncated_streamed_items_raise_value_error(self):
+        response = self.__streamed_response(200, b'[{"id": "1"}, {"id"')
+
+        with self.assertRaises(ValueError):
+            self.__get_items(response)
+        self.assertTrue(response.close.called)
+
+    @unittest.skipIf(request.ijson is None, 'ijson is not installed')
+    def test_broken_stream_raises_requests_error(self):
+        response = self.__streamed_response(200, b'')
+        response.raw = mock.Mock(read=mock.Mock(
+            side_effect=requests.packages.urllib3.exceptions.ProtocolError('connection broken')
+        ))
+
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            self.__get_items(response)
+        self.assertTrue(response.close.called)
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(unittest.main())
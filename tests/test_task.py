@@ -12,6 +12,11 @@ import unittest
 import json
 import vcr as vcr_module
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 from tests.base import TestCase
 from tests.test_helper import vcr, scrub_string
 
@@ -392,6 +397,42 @@ class TestTask(TestCase):
             shared_task = new_member.tasks(refresh=True)[0]
             self.assertEqual(task['title'], shared_task['title'])
 
+    def test_empty_pending_tasks_are_cached_and_not_require_additional_request(self):
+        user = self.get_me()
+        with vcr.use_cassette(
+            'fixtures/vcr_cassettes/task_user_pending_tasks_after_approve.json',
+            record_mode='once'
+        ):
+            self.assertEqual([], user.pending_tasks())
+            self.assertEqual([], user.pending_tasks())
+
+    def test_pending_tasks_could_be_approved_in_batch(self):
+        user = self.get_me()
+        self.assertEqual(({}, {}), user.approve_pending_tasks([]))
+
+        with vcr.use_cassette('fixtures/vcr_cassettes/task_user_approve_pending_task.json'):
+            approved, failed = user.approve_pending_tasks(['8BS2LIUEOYgDSDIggp7Zug=='])
+            self.assertEqual(['8BS2LIUEOYgDSDIggp7Zug=='], list(approved))
+            self.assertEqual({}, failed)
+
+    def test_failed_approvals_in_batch_do_not_hide_successful_ones(self):
+        user = self.get_me()
+        api_error = errors.BadRequestError('invalid id')
+        decode_error = ValueError('empty body')
+
+        def approve(pending_task_id):
+            if pending_task_id == 'bad':
+                raise api_error
+            if pending_task_id == 'empty':
+                raise decode_error
+            return {'id': pending_task_id}
+
+        with mock.patch.object(user, 'approve_pending_task', side_effect=approve):
+            approved, failed = user.approve_pending_tasks(['good', 'bad', 'empty'])
+
+        self.assertEqual({'good': {'id': 'good'}}, approved)
+        self.assertEqual({'bad': api_error, 'empty': decode_error}, failed)
+
 if __name__ == '__main__':
     import sys
     sys.exit(unittest.main())